@@ -1,35 +1,132 @@
 import numpy as np
 import matplotlib.pyplot as plt
+from matplotlib.animation import FuncAnimation
 from matplotlib.patches import Circle
 from matplotlib.ticker import ScalarFormatter
+from scipy.stats import qmc
 import argparse
+from concurrent.futures import ThreadPoolExecutor
 
-# Monte Carlo Main Function
-def monte_carlo_pi(simulation_limit, update_interval, seed):
-    
-    if seed is not None:
-        np.random.seed(seed)
-        print(f"[INFO] Random seed set to {seed} for reproducibility.")
-    else:
-        print("[INFO] No seed provided. Using random initialization.")
+TILE = 16384  # samples per block, small enough for the working set to stay in cache
+MAX_SCATTER = 10000  # most dots kept for (and drawn in) the live scatter
+BLOCK = 64 * TILE  # samples per independent stream in the error analysis sweep
+
+# Flag the points of one tile that land inside the quarter circle, using the two rows of sq as scratch space.
+# All arguments are contiguous tile buffers, so every step runs in NumPy's SIMD ufunc loops.
+def _inside_circle(x, y, sq, inside):
+    # r <= 1 is equivalent to r^2 <= 1, so skip the sqrt; every step writes into a buffer that already exists
+    np.multiply(x, x, out=sq[0])
+    np.multiply(y, y, out=sq[1])
+    np.add(sq[0], sq[1], out=sq[0])
+    np.less_equal(sq[0], 1.0, out=inside)
+
+# Reusable tile buffers and point source for the blocked sampling loops: every draw
+# goes into the same preallocated arrays, so the loops never allocate per tile.
+# method "mc" draws pseudo-random points, "qmc" a scrambled Sobol' low-discrepancy sequence.
+class MCState:
+    def __init__(self, rng, method="mc", tile=TILE):
+        self.rng = rng
+        self.sobol = qmc.Sobol(d=2, seed=rng) if method == "qmc" else None
+        self.x = np.empty(tile, dtype=np.float32)
+        self.y = np.empty(tile, dtype=np.float32)
+        self.sq = np.empty((2, tile), dtype=np.float32)  # scratch for x^2 and y^2
+        self.inside = np.empty(tile, dtype=bool)
+
+    # Draw the next `size` points (size <= tile) and flag those inside the circle; returns views into the buffers
+    def sample(self, size):
+        x, y, inside = self.x[:size], self.y[:size], self.inside[:size]
+        if self.sobol is not None:
+            # Always draw a full power-of-two tile to keep the Sobol' balance properties (a short last tile just uses a prefix)
+            points = self.sobol.random(len(self.x))[:size]
+            x[:], y[:] = points[:, 0], points[:, 1]
+        else:
+            self.rng.random(out=x, dtype=np.float32)
+            self.rng.random(out=y, dtype=np.float32)
+        _inside_circle(x, y, self.sq[:, :size], inside)
+        return x, y, inside
+
+# Vitter's Algorithm L: stream positions in [nxt, end) that replace a reservoir slot, found by drawing the
+# geometric gaps between replacements rather than one number per point. w and nxt carry the state across tiles.
+def _reservoir_skips(rng, k, w, nxt, end):
+    positions = []
+    while nxt < end:
+        m = int(k * np.log(end / nxt)) + 16  # about the number of replacements expected before end
+        ws = w * np.exp(np.log(rng.random(m)) / k).cumprod()
+        gaps = np.floor(np.log(rng.random(m)) / np.log1p(-ws)).astype(np.int64) + 1
+        pos = nxt + np.concatenate(([0], np.cumsum(gaps)))
+        taken = min(np.searchsorted(pos, end), m)  # replacements from this batch that land before end
+        positions.append(pos[:taken])
+        nxt, w = pos[taken], ws[taken - 1]
+    return np.concatenate(positions) if positions else np.empty(0, dtype=np.int64), w, nxt
 
-    # Monte Carlo Sampling
-    x = np.random.uniform(0, 1, simulation_limit)
-    y = np.random.uniform(0, 1, simulation_limit)
-    r = np.sqrt(x**2 + y**2)
-    inside = r <= 1
+# Sample counts at which the live plot draws a frame
+def _frame_ns(simulation_limit, update_interval):
+    frame_ns = np.arange(update_interval, simulation_limit + 1, update_interval)
+    if len(frame_ns) == 0:
+        frame_ns = np.array([simulation_limit])  # a run shorter than one interval still gets a single frame
+    return frame_ns
 
-    # Progressive π estimates and error values
-    pi_estimates = 4 * np.cumsum(inside) / np.arange(1, simulation_limit + 1)
-    error_values = 100 * np.abs(pi_estimates - np.pi) / np.pi  # Percent error
+# Blocked sampling: only the π estimates are kept in full, the scatter gets a reservoir of at most MAX_SCATTER points
+# and the exact hit count is recorded at every frame
+def _simulate(n, rng, method, frame_ns):
+    state = MCState(rng, method)
+    pi_estimates = np.empty(n, dtype=np.float64)
+    frame_hits = np.empty(len(frame_ns), dtype=np.int64)
+    tile_hits = np.empty(TILE, dtype=np.int64)  # running hit count of the current tile
+    hits_so_far = 0
 
+    # Reservoir sample (Vitter's Algorithm L) of the points, with their position in the stream
+    k = min(n, MAX_SCATTER)
+    sample_x = np.empty(k, dtype=np.float32)
+    sample_y = np.empty(k, dtype=np.float32)
+    sample_idx = np.empty(k, dtype=np.int64)
+    w = np.exp(np.log(rng.random()) / k)
+    nxt = k + int(np.log(rng.random()) / np.log1p(-w))  # first stream position after the fill that gets kept
+
+    for start in range(0, n, TILE):
+        end = min(start + TILE, n)
+        x, y, inside = state.sample(end - start)
+
+        # The first k points fill the reservoir, after that only the points Algorithm L picks replace a random slot
+        fill = max(0, min(end, k) - start)
+        sample_x[start:start + fill] = x[:fill]
+        sample_y[start:start + fill] = y[:fill]
+        sample_idx[start:start + fill] = np.arange(start, start + fill)
+        idx, w, nxt = _reservoir_skips(rng, k, w, nxt, end)
+        slots = rng.integers(0, k, size=len(idx))
+        sample_x[slots] = x[idx - start]
+        sample_y[slots] = y[idx - start]
+        sample_idx[slots] = idx
+
+        # Blocked prefix sum: scan the tile while it is still in cache, offset by the hits of earlier tiles
+        hits = tile_hits[:end - start]
+        np.cumsum(inside, out=hits)
+        hits += hits_so_far
+        hits_so_far = hits[-1]
+        in_tile = slice(*np.searchsorted(frame_ns, [start, end], side="right"))  # frames that end in (start, end]
+        frame_hits[in_tile] = hits[frame_ns[in_tile] - start - 1]
+
+        # Running hit count turned into π estimates
+        block = pi_estimates[start:end]
+        np.multiply(hits, 4, out=block)
+        block /= np.arange(start + 1, end + 1)
+
+    # Stream order, so the animation can reveal the sample progressively
+    order = np.argsort(sample_idx)
+    sample_x, sample_y, sample_idx = sample_x[order], sample_y[order], sample_idx[order]
+    sample_inside = sample_x * sample_x + sample_y * sample_y <= 1.0
+
+    return sample_x, sample_y, sample_inside, sample_idx, pi_estimates, frame_hits
+
+# Live visualisation of the precomputed simulation
+def _animate(x, y, inside, sample_idx, pi_estimates, frame_ns, frame_hits, simulation_limit, update_interval):
     # Setup of Plot
     plt.style.use("dark_background")
     fig, axis = plt.subplots(1, 2, figsize=(10, 5))
     fig.canvas.manager.set_window_title("Monte Carlo Simulation for Estimation of π")
 
     # Graph on the Left
-    axis[0].set_title('Randomly Generated Dots')
+    dots_title = axis[0].set_title('Randomly Generated Dots')  # kept so frames only need set_text
     axis[0].set_aspect('equal', 'box')
     axis[0].set_xlim([0, 1])
     axis[0].set_ylim([0, 1])
@@ -37,7 +134,7 @@ def monte_carlo_pi(simulation_limit, update_interval, seed):
     axis[0].add_patch(circle)
 
     # Graph on the Right
-    axis[1].set_title('Approximating π')
+    pi_title = axis[1].set_title('Approximating π')
     axis[1].set_xlim([0, update_interval])
     axis[1].set_ylim([2, 4])
     axis[1].grid(True)
@@ -52,17 +149,29 @@ def monte_carlo_pi(simulation_limit, update_interval, seed):
     plot, = axis[1].plot([], [], "#1A80BB", label="Estimate", linewidth=1)
     axis[1].legend()
 
-    for n in range(update_interval, simulation_limit + 1, update_interval):
-        scatter.set_offsets(np.column_stack((x[:n], y[:n])))
-        scatter.set_facecolors(np.where(inside[:n], "#1A80BB", "#A00000"))
-        plot.set_data(np.arange(1, n + 1), pi_estimates[:n])
+    # The scatter only ever shows the reservoir sample, revealed in stream order
+    scatter_xy = np.column_stack((x, y))
+    scatter_colors = np.where(inside, "#1A80BB", "#A00000")
+    sample_counts = np.arange(1, simulation_limit + 1)
+
+    # Min/max of the estimate over each frame's window [n - update_interval, n), all in one vectorised pass
+    window_starts = np.maximum(frame_ns - update_interval, 0)
+    framed_estimates = pi_estimates[:frame_ns[-1]]
+    window_mins = np.minimum.reduceat(framed_estimates, window_starts)
+    window_maxs = np.maximum.reduceat(framed_estimates, window_starts)
+
+    def update(frame):
+        n = frame_ns[frame]
+        shown = np.searchsorted(sample_idx, n)  # sampled dots that come from the first n samples
+        scatter.set_offsets(scatter_xy[:shown])
+        scatter.set_facecolors(scatter_colors[:shown])
+        plot.set_data(sample_counts[:n], pi_estimates[:n])
 
         # Dynamic scaling
         if n > axis[1].get_xlim()[1] - update_interval:
             axis[1].set_xlim([0, n + update_interval])
 
-        recent_slice = pi_estimates[max(0, n - update_interval):n]
-        min_y, max_y = np.min(recent_slice), np.max(recent_slice)
+        min_y, max_y = window_mins[frame], window_maxs[frame]
         new_ylim = [min_y - 0.05, max_y + 0.05]
         prev_ylim = axis[1].get_ylim()
         smooth_ylim = [
@@ -72,22 +181,85 @@ def monte_carlo_pi(simulation_limit, update_interval, seed):
         axis[1].set_ylim(smooth_ylim)
 
         current_pi = pi_estimates[n - 1]
-        current_error = error_values[n - 1]
-        axis[0].set_title(f"Dots in Circle: {inside[:n].sum()} / {n}")
-        axis[1].set_title(f"π ≈ {current_pi:.6f}  |  Error: {current_error:.4f}%")
+        current_error = 100 * abs(current_pi - np.pi) / np.pi  # Percent error, only needed at the frame points
+        dots_title.set_text(f"Dots in Circle: {frame_hits[frame]} / {n}")  # exact count recorded by _simulate
+        pi_title.set_text(f"π ≈ {current_pi:.6f}  |  Error: {current_error:.4f}%")
 
-        plt.pause(0.001)
+        return scatter, plot, dots_title, pi_title
 
+    # Let matplotlib drive the frames instead of pumping the GUI with plt.pause;
+    # no blitting because the axis limits move every frame
+    anim = FuncAnimation(fig, update, frames=len(frame_ns), interval=1, repeat=False)
     plt.show()
 
-    # Return data for reuse if needed
+# Monte Carlo Main Function
+def monte_carlo_pi(simulation_limit, update_interval, seed, method="mc"):
+    
+    rng = np.random.default_rng(seed)
+    if seed is not None:
+        print(f"[INFO] Random seed set to {seed} for reproducibility.")
+    else:
+        print("[INFO] No seed provided. Using random initialization.")
+
+    # Monte Carlo Sampling and progressive π estimates
+    frame_ns = _frame_ns(simulation_limit, update_interval)
+    x, y, inside, sample_idx, pi_estimates, frame_hits = _simulate(simulation_limit, rng, method, frame_ns)
+    _animate(x, y, inside, sample_idx, pi_estimates, frame_ns, frame_hits, simulation_limit, update_interval)
+
+    # Return data for reuse if needed (x, y and inside are the plotted sample, not every point)
     return x, y, inside, pi_estimates
 
+# Hits in samples [start, end) of one stream, at the ascending checkpoints that fall in (start, end], plus the block total
+def _block_hits(start, end, checkpoints, rng, method):
+    state = MCState(rng, method)
+    local = np.zeros(len(checkpoints), dtype=np.int64)
+    hits = 0
+    k = np.searchsorted(checkpoints, start, side="right")  # next checkpoint to fill
+
+    for lo in range(start, end, TILE):
+        hi = min(lo + TILE, end)
+        _, _, inside = state.sample(hi - lo)
+
+        # Checkpoints that fall inside this tile only need a partial count
+        while k < len(checkpoints) and checkpoints[k] <= hi:
+            local[k] = hits + np.count_nonzero(inside[:checkpoints[k] - lo])
+            k += 1
+        hits += np.count_nonzero(inside)
+
+    return local, hits
+
+# Hits among the first N samples, for every N in the ascending checkpoints.
+# The samples are split into fixed blocks with independent child streams and counted on a thread pool
+# (NumPy releases the GIL while filling and testing the tiles); block sizes do not depend on the core
+# count, so a seed gives the same result on every machine.
+def _count_hits(checkpoints, rng, method):
+    n = checkpoints[-1]
+    if method == "qmc":
+        # A Sobol' sequence has one canonical order, so it stays a single block
+        blocks = [(0, n)]
+        streams = [rng]
+    else:
+        blocks = [(start, min(start + BLOCK, n)) for start in range(0, n, BLOCK)]
+        streams = rng.spawn(len(blocks))
+
+    with ThreadPoolExecutor() as executor:
+        results = list(executor.map(lambda block, stream: _block_hits(*block, checkpoints, stream, method),
+                                    blocks, streams))
+
+    # Stitch the blocks together: offset every block's local counts by the hits of the blocks before it
+    counts = np.empty(len(checkpoints), dtype=np.int64)
+    hits_before = 0
+    for (start, end), (local, hits) in zip(blocks, results):
+        in_block = (checkpoints > start) & (checkpoints <= end)
+        counts[in_block] = hits_before + local[in_block]
+        hits_before += hits
+
+    return counts
+
 # Error Analysis Function
-def error_analysis(seed, x, y, inside, pi_estimates):
+def error_analysis(seed, x=None, y=None, inside=None, pi_estimates=None, method="mc"):
     
     if seed is not None:
-        np.random.seed(seed)
         print(f"[INFO] Random seed set to {seed} for reproducibility.")
 
     if x is not None and y is not None and inside is not None and pi_estimates is not None:
@@ -99,13 +271,10 @@ def error_analysis(seed, x, y, inside, pi_estimates):
         print("[INFO] Running new Monte Carlo error analysis...")
         # Multiple sample sizes from 1e2 to 1e7
         N_values = np.logspace(2, 7, 20, dtype=int)
-        errors = []
-        for N in N_values:
-            x_sample = np.random.uniform(-1, 1, N)
-            y_sample = np.random.uniform(-1, 1, N)
-            inside_circle = x_sample**2 + y_sample**2 <= 1
-            pi_est = 4 * np.mean(inside_circle)
-            errors.append(abs(pi_est - np.pi))
+        # One stream of max(N) samples, read off at every N, instead of a fresh draw per sample size
+        rng = np.random.default_rng(seed)
+        pi_est = 4 * _count_hits(N_values, rng, method) / N_values
+        errors = np.abs(pi_est - np.pi)
 
     # Theoretical CLT reference: 1/sqrt(N), scaled to match first error
     ref_line = 1 / np.sqrt(N_values)
@@ -113,9 +282,18 @@ def error_analysis(seed, x, y, inside, pi_estimates):
 
     # Plot log-log
     plt.figure(figsize=(8, 6))
-    plt.loglog(N_values, errors, 'o', label='Monte Carlo Error', linewidth=2)
+    label = 'Quasi-Monte Carlo Error' if method == "qmc" else 'Monte Carlo Error'
+    plt.loglog(N_values, errors, 'o', label=label, linewidth=2)
     plt.loglog(N_values, ref_line, '--', label=r'$1/\sqrt{N}$ CLT Reference', linewidth=2)
-    plt.title("Monte Carlo π Estimation Error vs Sample Size (CLT Comparison)", fontsize=14)
+    if method == "qmc":
+        # Idealised 1/N line for smooth integrands; the disk indicator is discontinuous, so expect roughly N^(-3/4)
+        qmc_line = 1 / N_values
+        qmc_line *= errors[0] / qmc_line[0]
+        plt.loglog(N_values, qmc_line, ':', label=r'Idealised $1/N$ Reference (smooth integrands)', linewidth=2)
+    if method == "qmc":
+        plt.title("Quasi-Monte Carlo π Estimation Error vs Sample Size (Sobol' Points)", fontsize=14)
+    else:
+        plt.title("Monte Carlo π Estimation Error vs Sample Size (CLT Comparison)", fontsize=14)
     plt.xlabel("Number of Samples (N)")
     plt.ylabel("Absolute Error |π_est - π|")
     plt.legend()
@@ -131,6 +309,8 @@ def main():
     parser.add_argument("--seed", type=int, default=None, help="Random seed for reproducibility")
     parser.add_argument("--analysis", action="store_true", help="Run error analysis instead of simulation")
     parser.add_argument("--reuse", action="store_true", help="Reuse simulation data for error analysis")
+    parser.add_argument("--method", choices=["mc", "qmc"], default="mc",
+                        help="Sampling method: pseudo-random Monte Carlo or Sobol' quasi-Monte Carlo")
 
     args = parser.parse_args()
 
@@ -138,16 +318,18 @@ def main():
         # Run simulation first and reuse data
         x, y, inside, pi_estimates = monte_carlo_pi(simulation_limit=args.limit,
                                                     update_interval=args.interval,
-                                                    seed=args.seed)
-        error_analysis(x=x, y=y, inside=inside, pi_estimates=pi_estimates, seed=args.seed)
+                                                    seed=args.seed,
+                                                    method=args.method)
+        error_analysis(x=x, y=y, inside=inside, pi_estimates=pi_estimates, seed=args.seed, method=args.method)
     elif args.analysis:
         # Run error analysis independently
-        error_analysis(seed=args.seed)
+        error_analysis(seed=args.seed, method=args.method)
     else:
         # Run normal simulation
         monte_carlo_pi(simulation_limit=args.limit,
                        update_interval=args.interval,
-                       seed=args.seed)
+                       seed=args.seed,
+                       method=args.method)
 
 if __name__ == "__main__":
     main()
@@ -5,31 +5,47 @@ import argparse
 
 plt.style.use("dark_background")
 
+## Random steps of ±1 with equal probability, one row of n_steps per walk
+def _random_steps(rng, n_steps, num_walks = None):
+    shape = (n_steps + 7) // 8 if num_walks is None else (num_walks, (n_steps + 7) // 8)
+    words = rng.integers(0, 256, size = shape, dtype = np.uint8) # each random byte gives 8 coin flips
+    steps = np.unpackbits(words, axis = -1, count = n_steps).view(np.int8) # bits 0/1
+    np.multiply(steps, 2, out = steps) # 2b ...
+    np.subtract(steps, 1, out = steps) # ... - 1 maps the bits to ±1 in place without leaving int8
+
+    return steps
+
 ## Algorithm for the position after n steps in the walk
-def random_walk_1d(n_steps):
-    # Generate random steps of ±1 with equal probability
-    steps = np.random.choice([1, -1], size = n_steps)
+def random_walk_1d(n_steps, rng = None):
+    if rng is None:
+        rng = np.random.default_rng()
+    steps = _random_steps(rng, n_steps)
 
-    position = np.cumsum(steps) # cumulative sum gives final position after n steps
-    position = np.insert(position, 0, 0)  # make starting point the origin
+    position = np.zeros(n_steps + 1, dtype = np.int32) # position[0] = 0 makes the starting point the origin
+    np.cumsum(steps, out = position[1:]) # cumulative sum gives final position after n steps (int32 so it cannot overflow)
 
     return position
 
 ## Find the final positions of multiple walks
-def end_positions(num_walks, n_steps):
-    final_positions = []
-    
-    for _ in range(num_walks):
-        walk = random_walk_1d(n_steps) # generate a random walk
-        final_positions.append(walk[-1]) # find the last element in the position array and append to the final position array
-    
-    return np.array(final_positions) # return the final positions
+def end_positions(num_walks, n_steps, rng = None, chunk = 1024):
+    if rng is None:
+        rng = np.random.default_rng()
+    final_positions = np.empty(num_walks, dtype = np.int32)
+
+    # Only the last position matters, so sum the steps of a whole block of walks at once (no cumsum needed)
+    for start in range(0, num_walks, chunk): # work through the walks in blocks to bound memory
+        end = min(start + chunk, num_walks)
+        steps = _random_steps(rng, n_steps, end - start)
+        final_positions[start:end] = steps.sum(axis = 1, dtype = np.int32)
+
+    return final_positions # return the final positions
 
 ## Plot the graphs
 def plot_walks(num_walks, n_steps, num_sample_paths):
     # Generate data
-    sample_walks = [random_walk_1d(n_steps) for _ in range(num_sample_paths)]
-    final_positions = end_positions(num_walks, n_steps)
+    rng = np.random.default_rng()
+    sample_walks = [random_walk_1d(n_steps, rng) for _ in range(num_sample_paths)]
+    final_positions = end_positions(num_walks, n_steps, rng)
     # Create plot
     plt.figure(figsize=(12,6), num="Random Walks Data Visualisation") # dimensions 12in x 5in
     # Plot the single walk
@@ -44,13 +60,20 @@ def plot_walks(num_walks, n_steps, num_sample_paths):
     plt.grid(True)
     # Plot the Histogram
     plt.subplot(1, 2, 2) # plt the graph on the right
-    plt.hist(final_positions,   # what data are we using
-             bins = 50,         # how many bars are there
-             density = True,    # area under the histogram = 1
-             alpha = 1.00,      # opacity of the bars
-             color = "#A00000", label = "Final Positions")
+    # Count every integer end position once with bincount, then rebin those counts into 50 bars (cheaper than plt.hist on the raw data)
+    lo, hi = final_positions.min(), final_positions.max()
+    counts = np.bincount(final_positions - lo) # counts[i] = number of walks ending at lo + i
+    edges = np.linspace(lo, hi, 51) if hi > lo else np.linspace(lo - 0.5, hi + 0.5, 51) # 50 bins over the data range, like plt.hist
+    which = np.minimum(np.digitize(np.arange(lo, hi + 1), edges) - 1, 49) # bin of each position (last bin includes its right edge)
+    hist = np.bincount(which, weights = counts, minlength = 50)
+    width = edges[1] - edges[0]
+    plt.bar((edges[:-1] + edges[1:]) / 2,         # bar centres
+            hist / (width * final_positions.size), # density: area under the histogram = 1
+            width = width,
+            alpha = 1.00,                          # opacity of the bars
+            color = "#A00000", label = "Final Positions")
     # Overlap Normal Distribution Curve
-    x_values = np.linspace(min(final_positions), max(final_positions), 250) # creates 250 evenly spaced points from the range of the final_positions
+    x_values = np.linspace(lo, hi, 250) # creates 250 evenly spaced points from the range of the final_positions
     pdf = norm.pdf(x_values, 0, np.sqrt(n_steps)) # P.D.F. with N(0, √N) for the data from x_values
     plt.plot(x_values, pdf, color = "#1A80BB", lw = 2.5, label = "N(0, √N)", alpha = 1.00)
     plt.title(f"Distribution of End Positions of {num_walks} Random Walks")